@@ -16,30 +16,42 @@ import sys
 import json
 import time
 import logging
-import random
-import string
+import secrets
 import os
 import subprocess
-from dataclasses import dataclass
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, Any, Optional, Tuple
 from enum import Enum
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     print("Error: requests library not found. Install it with: pip install requests")
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # ============================================================================
 # Configuration
 # ============================================================================
 
+@functools.lru_cache(maxsize=1)
 def get_alb_url_from_terraform() -> str:
     """
     Get ALB URL from Terraform output or environment variable
     
+    Resolved lazily on first use and cached, so importing this module
+    does not spawn a terraform subprocess.
+    
     Priority:
     1. Environment variable ALB_URL
     2. Terraform output (terraform output -raw alb_dns_name)
@@ -78,7 +90,7 @@ def get_alb_url_from_terraform() -> str:
 @dataclass
 class APIConfig:
     """API endpoint configuration"""
-    base_url: str = get_alb_url_from_terraform()
+    base_url: str = field(default_factory=get_alb_url_from_terraform)
     
     @property
     def users(self) -> str:
@@ -130,10 +142,16 @@ class ColoredFormatter(logging.Formatter):
         logging.ERROR: Colors.RED + "%(message)s" + Colors.NC,
     }
 
+    def __init__(self):
+        super().__init__()
+        # Build one formatter per level up front instead of per record
+        self._formatters = {
+            level: logging.Formatter(fmt) for level, fmt in self.FORMATS.items()
+        }
+        self._default = logging.Formatter("%(message)s")
+
     def format(self, record):
-        log_fmt = self.FORMATS.get(record.levelno, "%(message)s")
-        formatter = logging.Formatter(log_fmt)
-        return formatter.format(record)
+        return self._formatters.get(record.levelno, self._default).format(record)
 
 
 def setup_logger() -> logging.Logger:
@@ -155,42 +173,53 @@ logger = setup_logger()
 # Output Utilities
 # ============================================================================
 
+# Precomputed color prefixes for the output helpers below
+_SECTION_PREFIX = Colors.BLUE + Colors.BOLD
+_STEP_PREFIX = Colors.CYAN + Colors.BOLD + "[Step "
+_OK_PREFIX = Colors.GREEN + "✅ "
+_FAIL_PREFIX = Colors.RED + "❌ "
+_WARN_PREFIX = Colors.YELLOW + "⚠️  "
+_LABEL_PREFIX = Colors.CYAN
+_SECTION_BAR = _SECTION_PREFIX + "=" * 60 + Colors.NC
+
+
 def print_section(title: str, char: str = "=", width: int = 60) -> None:
     """Print a formatted section header"""
-    print(f"\n{Colors.BLUE}{Colors.BOLD}{char * width}{Colors.NC}")
-    print(f"{Colors.BLUE}{Colors.BOLD}{title.center(width)}{Colors.NC}")
-    print(f"{Colors.BLUE}{Colors.BOLD}{char * width}{Colors.NC}\n")
+    if char == "=" and width == 60:
+        bar = _SECTION_BAR
+    else:
+        bar = _SECTION_PREFIX + char * width + Colors.NC
+    print("\n" + bar + "\n" + _SECTION_PREFIX + title.center(width) + Colors.NC + "\n" + bar + "\n")
 
 
 def print_step(step_num: int, description: str) -> None:
     """Print a test step header"""
-    print(f"\n{Colors.CYAN}{Colors.BOLD}[Step {step_num}]{Colors.NC} {description}")
+    print("\n" + _STEP_PREFIX + str(step_num) + "]" + Colors.NC + " " + description)
 
 
 def print_result(success: bool, message: str) -> None:
     """Print a result message with appropriate formatting"""
-    icon = "✅" if success else "❌"
-    color = Colors.GREEN if success else Colors.RED
-    print(f"{color}{icon} {message}{Colors.NC}")
+    print((_OK_PREFIX if success else _FAIL_PREFIX) + message + Colors.NC)
 
 
 def print_warning(message: str) -> None:
     """Print a warning message"""
-    print(f"{Colors.YELLOW}⚠️  {message}{Colors.NC}")
+    print(_WARN_PREFIX + message + Colors.NC)
 
 
 def print_detail(label: str, value: Any, indent: int = 3) -> None:
     """Print a detailed information line"""
-    spacing = " " * indent
-    print(f"{spacing}{Colors.CYAN}{label}:{Colors.NC} {value}")
+    print(" " * indent + _LABEL_PREFIX + label + ":" + Colors.NC + " " + str(value))
 
 
 def print_json_response(data: Dict[Any, Any], indent: int = 3) -> None:
     """Pretty print JSON response with indentation"""
     spacing = " " * indent
-    json_str = json.dumps(data, indent=2)
-    for line in json_str.split('\n'):
-        print(f"{spacing}{line}")
+    if orjson is not None:
+        json_str = orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    else:
+        json_str = json.dumps(data, indent=2)
+    sys.stdout.write(spacing + json_str.replace('\n', '\n' + spacing) + '\n')
 
 
 # ============================================================================
@@ -208,7 +237,7 @@ def generate_random_username(prefix: str = "user", length: int = 8) -> str:
     Returns:
         Random username string
     """
-    random_suffix = ''.join(random.choices(string.ascii_lowercase + string.digits, k=length))
+    random_suffix = secrets.token_hex((length + 1) // 2)[:length]
     return f"{prefix}_{random_suffix}"
 
 
@@ -223,7 +252,19 @@ class TimelineAPIClient:
         self.config = config
         self.timeout = timeout
         self.session = requests.Session()
-        self.session.headers.update({"Content-Type": "application/json"})
+        
+        # Larger keep-alive pool with retries on transient gateway errors
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
+            "Content-Type": "application/json",
+            "Connection": "keep-alive"
+        })
     
     def _make_request(
         self, 
@@ -245,6 +286,8 @@ class TimelineAPIClient:
                 **kwargs
             )
             response.raise_for_status()
+            if orjson is not None:
+                return True, orjson.loads(response.content), None
             return True, response.json(), None
         except requests.exceptions.Timeout:
             return False, None, "Request timed out"
@@ -335,6 +378,40 @@ class ValidationResult:
     details: Dict[str, Any]
 
 
+@dataclass
+class TimelinePost:
+    """Typed view of a single timeline entry"""
+    post_id: Any
+    author_id: Any
+    content: str = ''
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TimelinePost":
+        return cls(
+            post_id=data.get('post_id'),
+            author_id=data.get('author_id'),
+            content=data.get('content') or ''
+        )
+
+
+@dataclass
+class TimelineResponse:
+    """Typed view of a timeline API response
+    
+    Only the first post is decoded, since validation never looks further.
+    """
+    total_count: int
+    first_post: Optional[TimelinePost]
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TimelineResponse":
+        timeline = data.get('timeline') or []
+        return cls(
+            total_count=data.get('total_count', 0),
+            first_post=TimelinePost.from_dict(timeline[0]) if timeline else None
+        )
+
+
 class TimelineValidator:
     """Validates timeline API responses"""
     
@@ -356,13 +433,11 @@ class TimelineValidator:
         warnings = []
         details = {}
         
-        total_count = timeline_data.get('total_count', 0)
-        timeline = timeline_data.get('timeline', [])
-        
-        details['total_posts'] = total_count
+        response = TimelineResponse.from_dict(timeline_data)
+        details['total_posts'] = response.total_count
         
         # Check if timeline has posts
-        if total_count < 1:
+        if response.total_count < 1:
             return ValidationResult(
                 passed=False,
                 warnings=["Timeline is empty (expected at least 1 post)"],
@@ -370,11 +445,11 @@ class TimelineValidator:
             )
         
         # Validate first post
-        if len(timeline) > 0:
-            first_post = timeline[0]
-            post_id = first_post.get('post_id')
-            author_id = first_post.get('author_id')
-            content = first_post.get('content', '')
+        first_post = response.first_post
+        if first_post is not None:
+            post_id = first_post.post_id
+            author_id = first_post.author_id
+            content = first_post.content
             
             details['first_post'] = {
                 'post_id': post_id,
@@ -419,6 +494,9 @@ class TimelineTestSuite:
         print_section("Timeline Service E2E Test Suite")
         
         try:
+            # Prime the connection pool so step timings exclude connection setup
+            self._warm_up_connection()
+            
             # Step 1: Create users
             user_a_id, user_b_id = self._test_user_creation()
             
@@ -426,7 +504,7 @@ class TimelineTestSuite:
             self._test_follow_relationship(user_a_id, user_b_id)
             
             # Step 3: Create post
-            post_id = self._test_post_creation(user_b_id)
+            post_id = self._test_post_creation(user_b_id, user_a_id)
             
             # Step 4: Fetch and validate timeline
             result = self._test_timeline_retrieval(user_a_id, user_b_id)
@@ -447,6 +525,13 @@ class TimelineTestSuite:
         finally:
             self.client.close()
     
+    def _warm_up_connection(self) -> None:
+        """Issue a health check to establish a pooled connection; errors are ignored"""
+        try:
+            self.client.session.get(f"{self.config.base_url}/health", timeout=5)
+        except requests.exceptions.RequestException:
+            pass
+    
     def _test_user_creation(self) -> Tuple[int, int]:
         """Test user creation"""
         print_step(1, "Creating test users...")
@@ -455,24 +540,29 @@ class TimelineTestSuite:
         username_a = generate_random_username("test_user_a")
         username_b = generate_random_username("test_user_b")
         
-        # Create User A
-        success, user_a_id, data = self.client.create_user(username_a)
-        if not success:
-            print_result(False, f"Failed to create User A: {data}")
-            sys.exit(TestResult.FAILURE.value)
-        
-        print_result(True, f"User A created (ID: {user_a_id}, username: {username_a})")
-        print_json_response(data)
-        
-        # Create User B
-        success, user_b_id, data = self.client.create_user(username_b)
-        if not success:
-            print_result(False, f"Failed to create User B: {data}")
-            sys.exit(TestResult.FAILURE.value)
-        
-        print_result(True, f"User B created (ID: {user_b_id}, username: {username_b})")
-        print_json_response(data)
+        # Create both users concurrently; results are keyed by username so
+        # the reported order stays A then B
+        results = {}
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {
+                executor.submit(self.client.create_user, username): username
+                for username in (username_a, username_b)
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        
+        user_ids = []
+        for label, username in (("A", username_a), ("B", username_b)):
+            success, user_id, data = results[username]
+            if not success:
+                print_result(False, f"Failed to create User {label}: {data}")
+                sys.exit(TestResult.FAILURE.value)
+            
+            print_result(True, f"User {label} created (ID: {user_id}, username: {username})")
+            print_json_response(data)
+            user_ids.append(user_id)
         
+        user_a_id, user_b_id = user_ids
         return user_a_id, user_b_id
     
     def _test_follow_relationship(self, follower_id: int, target_id: int) -> None:
@@ -487,7 +577,7 @@ class TimelineTestSuite:
         print_result(True, f"User A now follows User B")
         print_json_response(data)
     
-    def _test_post_creation(self, author_id: int) -> Any:
+    def _test_post_creation(self, author_id: int, reader_id: int) -> Any:
         """Test post creation"""
         print_step(3, f"Creating post by User B...")
         
@@ -503,11 +593,40 @@ class TimelineTestSuite:
         print_json_response(data)
         
         # Wait for indexing
-        print(f"\n{Colors.CYAN}⏳ Waiting 2s for post indexing...{Colors.NC}")
-        time.sleep(2)
+        print(f"\n{Colors.CYAN}⏳ Waiting for post to appear in timeline...{Colors.NC}")
+        if not self._wait_for_post_in_timeline(reader_id, post_id):
+            print_warning(f"Post {post_id} did not appear in the timeline before the deadline")
         
         return post_id
     
+    def _wait_for_post_in_timeline(
+        self, 
+        user_id: int, 
+        post_id: Any, 
+        timeout: float = 5.0
+    ) -> bool:
+        """
+        Poll the timeline with exponential backoff until post_id shows up
+        
+        Returns:
+            True if the post appeared before the deadline, False otherwise
+        """
+        deadline = time.monotonic() + timeout
+        delay = 0.1
+        while True:
+            success, data = self.client.get_timeline(user_id)
+            if success and any(
+                str(post.get('post_id')) == str(post_id) 
+                for post in data.get('timeline') or []
+            ):
+                return True
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 1.0)
+    
     def _test_timeline_retrieval(
         self, 
         user_id: int, 
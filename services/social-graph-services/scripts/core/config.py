@@ -102,8 +102,10 @@ SEGMENTATION_SEED = 42
 # PERFORMANCE TUNING
 # =============================================================================
 
-# Maximum attempts when trying to find unique followees for a user
-MAX_FOLLOWEE_SELECTION_ATTEMPTS = 5
+# Follower shards for relationship seeding, each with its own RNG stream. The
+# generated graph depends on this (and the seed) but not on the worker count;
+# it also caps how many worker processes seeding can use
+SEEDING_SHARDS = 16
 
 # Maximum number of consecutive empty batches before stopping user scan (for gRPC validation)
 MAX_CONSECUTIVE_EMPTY_BATCHES = 5
@@ -111,6 +113,15 @@ MAX_CONSECUTIVE_EMPTY_BATCHES = 5
 # Batch size for gRPC BatchGetUserInfo calls
 GRPC_BATCH_SIZE = 100
 
+# Number of BatchGetUserInfo calls kept in flight while scanning for users
+GRPC_MAX_IN_FLIGHT = 32
+
+# DynamoDB BatchWriteItem limits and retry backoff for UnprocessedItems
+DYNAMODB_BATCH_SIZE = 20            # Items per request (hard limit 25); smaller eases cold-table throttling
+DYNAMODB_MAX_RETRIES = 8            # Re-submissions before giving up on a batch
+DYNAMODB_RETRY_BASE_DELAY = 0.05    # Seconds; doubled on every attempt
+DYNAMODB_RETRY_MAX_DELAY = 5.0      # Seconds; cap on a single backoff sleep
+
 # =============================================================================
 # VALIDATION SETTINGS
 # =============================================================================
@@ -118,6 +129,9 @@ GRPC_BATCH_SIZE = 100
 # Whether to validate ranges at runtime
 VALIDATE_RANGES = True
 
+# Every per-tier config dict must define exactly these tiers
+REQUIRED_TIERS = frozenset({"small", "medium", "big", "top"})
+
 # Ensure all tier percentages sum to approximately 1.0
 def validate_config():
     """Validate configuration values"""
@@ -127,15 +141,18 @@ def validate_config():
             raise ValueError(f"USER_TIER_RATIOS must sum to ~1.0, got {total_ratio}")
         
         # Check all tiers are defined
-        required_tiers = {"small", "medium", "big", "top"}
-        for config_dict in [USER_TIER_RATIOS, FOLLOWER_RATIOS, FOLLOWING_RATIOS, 
-                           TIER_WEIGHTS, FOLLOWER_ABSOLUTE_MINIMUMS, 
-                           FOLLOWING_ABSOLUTE_MINIMUMS]:
-            if set(config_dict.keys()) != required_tiers:
-                raise ValueError(f"All configs must define all tiers: {required_tiers}")
+        for config_dict in (USER_TIER_RATIOS, FOLLOWER_RATIOS, FOLLOWING_RATIOS,
+                            TIER_WEIGHTS, FOLLOWER_ABSOLUTE_MINIMUMS,
+                            FOLLOWING_ABSOLUTE_MINIMUMS):
+            if config_dict.keys() != REQUIRED_TIERS:
+                raise ValueError(f"All configs must define all tiers: {set(REQUIRED_TIERS)}")
+        
+        if not 1 <= DYNAMODB_BATCH_SIZE <= 25:
+            raise ValueError(f"DYNAMODB_BATCH_SIZE must be between 1 and 25, got {DYNAMODB_BATCH_SIZE}")
 
-# Validate on import
-validate_config()
+# Validate on import (skipped under `python -O`)
+if __debug__:
+    validate_config()
 
 # =============================================================================
 # UTILITY FUNCTIONS
@@ -147,36 +164,37 @@ def get_tier_names():
 
 def print_config_summary():
     """Print a summary of current configuration"""
-    print("\n" + "=" * 80)
-    print("Social Graph Generation Configuration")
-    print("=" * 80)
-    
-    print("\n📊 User Tier Ratios:")
+    lines = [
+        "\n" + "=" * 80,
+        "Social Graph Generation Configuration",
+        "=" * 80,
+        "\n📊 User Tier Ratios:",
+    ]
     for tier, ratio in USER_TIER_RATIOS.items():
-        print(f"  {tier.capitalize():<10} {ratio*100:>6.2f}%")
+        lines.append(f"  {tier.capitalize():<10} {ratio*100:>6.2f}%")
     
-    print("\n👥 Follower Ratios (% of total users):")
+    lines.append("\n👥 Follower Ratios (% of total users):")
     for tier in get_tier_names():
         min_pct, max_pct = FOLLOWER_RATIOS[tier]
         abs_min = FOLLOWER_ABSOLUTE_MINIMUMS[tier]
-        print(f"  {tier.capitalize():<10} {min_pct*100:>6.2f}% - {max_pct*100:>6.2f}%  (min: {abs_min})")
+        lines.append(f"  {tier.capitalize():<10} {min_pct*100:>6.2f}% - {max_pct*100:>6.2f}%  (min: {abs_min})")
     
-    print("\n🔗 Following Ratios (% of total users):")
+    lines.append("\n🔗 Following Ratios (% of total users):")
     for tier in get_tier_names():
         min_pct, max_pct = FOLLOWING_RATIOS[tier]
         abs_min = FOLLOWING_ABSOLUTE_MINIMUMS[tier]
         abs_max = FOLLOWING_ABSOLUTE_MAXIMUMS[tier]
-        print(f"  {tier.capitalize():<10} {min_pct*100:>6.2f}% - {max_pct*100:>6.2f}%  (min: {abs_min}, max: {abs_max})")
+        lines.append(f"  {tier.capitalize():<10} {min_pct*100:>6.2f}% - {max_pct*100:>6.2f}%  (min: {abs_min}, max: {abs_max})")
     
-    print("\n⚖️  Tier Weights (for follower selection):")
+    lines.append("\n⚖️  Tier Weights (for follower selection):")
     for tier, weight in TIER_WEIGHTS.items():
-        print(f"  {tier.capitalize():<10} {weight:>6}")
+        lines.append(f"  {tier.capitalize():<10} {weight:>6}")
     
-    print("\n🎲 Random Seed:")
-    print(f"  Segmentation: {SEGMENTATION_SEED}")
+    lines.append("\n🎲 Random Seed:")
+    lines.append(f"  Segmentation: {SEGMENTATION_SEED}")
     
-    print("=" * 80 + "\n")
-
+    lines.append("=" * 80 + "\n")
+    print("\n".join(lines))
 
 if __name__ == "__main__":
     # Print config when run directly
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+DynamoDB Writer Module
+
+Writes generated follower/following maps to the social graph tables.
+Shared by load_dynamodb.py and load_dynamodb_with_validation.py; batch size
+and retry settings are defined in config.py.
+"""
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+import boto3
+
+from . import config
+
+
+class _AimdLimiter:
+    """
+    Bound the BatchWriteItem calls in flight against one table
+    
+    The limit halves whenever a call comes back with UnprocessedItems and
+    grows back by roughly one per round of clean calls (AIMD), so writers
+    settle just under the table's throughput instead of bursting into
+    throttling on a cold table.
+    """
+    
+    def __init__(self, max_in_flight: int):
+        self.max_in_flight = max_in_flight
+        self.limit = float(max_in_flight)
+        self.in_flight = 0
+        self._cond = threading.Condition()
+    
+    def acquire(self):
+        with self._cond:
+            while self.in_flight >= int(self.limit):
+                self._cond.wait()
+            self.in_flight += 1
+    
+    def release(self, throttled: bool):
+        with self._cond:
+            self.in_flight -= 1
+            if throttled:
+                self.limit = max(1.0, self.limit / 2)
+            else:
+                self.limit = min(self.max_in_flight, self.limit + 1 / self.limit)
+            self._cond.notify_all()
+    
+    def abandon(self):
+        """Free a slot whose call failed, leaving the limit unchanged"""
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify_all()
+
+
+class _IdAttrs(dict):
+    """user_id -> {'S': ...} AttributeValue, built on first use and then shared"""
+    
+    def __missing__(self, user_id: int) -> dict:
+        attr = self[user_id] = {'S': str(user_id)}
+        return attr
+
+
+def _batch_write(client, table_name: str, requests: List[dict], limiter: _AimdLimiter):
+    """
+    Send one BatchWriteItem request, re-submitting UnprocessedItems
+    with jittered exponential backoff
+    """
+    request_items = {table_name: requests}
+    for attempt in range(config.DYNAMODB_MAX_RETRIES + 1):
+        limiter.acquire()
+        try:
+            response = client.batch_write_item(RequestItems=request_items)
+        except BaseException:
+            limiter.abandon()
+            raise
+        request_items = response.get('UnprocessedItems')
+        limiter.release(throttled=bool(request_items))
+        if not request_items:
+            return
+        if attempt == config.DYNAMODB_MAX_RETRIES:
+            break  # Out of retries: fail now rather than sleep first
+        delay = min(
+            config.DYNAMODB_RETRY_MAX_DELAY,
+            config.DYNAMODB_RETRY_BASE_DELAY * 2 ** attempt
+        )
+        time.sleep(delay + random.uniform(0, config.DYNAMODB_RETRY_BASE_DELAY))
+    
+    unprocessed = sum(len(reqs) for reqs in request_items.values())
+    raise RuntimeError(
+        f"{unprocessed} items still unprocessed for {table_name} "
+        f"after {config.DYNAMODB_MAX_RETRIES} retries"
+    )
+
+
+def _put_requests(
+    items: Iterable[Tuple[int, Set[int]]],
+    ids_attr: str,
+    id_attr: Dict[int, dict]
+) -> Iterator[dict]:
+    """
+    Yield a BatchWriteItem PutRequest for each (user_id, ids) pair
+    
+    Items are built directly in the low-level AttributeValue format, so
+    boto3's TypeSerializer never walks the (possibly 50K-entry) id lists.
+    """
+    to_attr = id_attr.__getitem__
+    for user_id, ids in items:
+        yield {'PutRequest': {'Item': {
+            'user_id': id_attr[user_id],
+            ids_attr: {'L': list(map(to_attr, ids))}
+        }}}
+
+
+def _write_shard(
+    table_name: str,
+    region: str,
+    items: List[Tuple[int, Set[int]]],
+    ids_attr: str,
+    id_attr: Dict[int, dict],
+    limiter: _AimdLimiter
+):
+    """Write one shard of (user_id, ids) pairs in BatchWriteItem-sized chunks"""
+    # Sessions are not thread-safe: one session/client per thread
+    client = boto3.session.Session().client('dynamodb', region_name=region)
+    requests = _put_requests(items, ids_attr, id_attr)
+    while True:
+        chunk = list(islice(requests, config.DYNAMODB_BATCH_SIZE))
+        if not chunk:
+            break
+        _batch_write(client, table_name, chunk, limiter)
+
+
+def _write_mapping(
+    mapping: Dict[int, Set[int]],
+    table_name: str,
+    ids_attr: str,
+    region: str,
+    workers: int,
+    id_attr: Dict[int, dict]
+):
+    """
+    Write user_id -> ids items to a table, sharded across worker threads
+    
+    Each thread writes its shard through its own client, so up to
+    `workers` BatchWriteItem requests are in flight instead of one;
+    a shared AIMD limiter backs that off while the table throttles.
+    """
+    items = [(user_id, ids) for user_id, ids in mapping.items() if ids]  # Only users with ids
+    workers = max(1, workers)
+    shards = [items[i::workers] for i in range(workers)]
+    limiter = _AimdLimiter(workers)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_write_shard, table_name, region, shard, ids_attr, id_attr, limiter)
+            for shard in shards if shard
+        ]
+        for future in futures:
+            future.result()
+
+
+def write_relationship_tables(
+    follower_map: Dict[int, Set[int]],
+    following_map: Dict[int, Set[int]],
+    followers_table_name: str,
+    following_table_name: str,
+    region: str,
+    workers: int = 8
+):
+    """
+    Write both relationship maps to their tables concurrently
+    
+    Args:
+        follower_map: Mapping of user_id -> set of follower IDs
+        following_map: Mapping of user_id -> set of following IDs
+        followers_table_name: Name of the followers table
+        following_table_name: Name of the following table
+        region: AWS region
+        workers: Writer threads per table
+    """
+    # Build each user id's {'S': ...} AttributeValue once, on first use; each
+    # id recurs in many id lists and the shared dicts are only ever read
+    id_attr = _IdAttrs()
+    
+    # Each table gets its own writer pool
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        followers_job = pool.submit(
+            _write_mapping, follower_map, followers_table_name, 'follower_ids', region, workers, id_attr
+        )
+        following_job = pool.submit(
+            _write_mapping, following_map, following_table_name, 'following_ids', region, workers, id_attr
+        )
+        followers_job.result()
+        following_job.result()
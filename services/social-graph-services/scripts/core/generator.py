@@ -6,12 +6,181 @@ Generates follow relationships using power-law distribution to simulate
 realistic social network patterns. All parameters are configured in config.py.
 """
 
-import random
-from typing import List, Dict, Set, Tuple
-from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Dict, Optional, Set, Tuple
+from itertools import chain
+
+import numpy as np
+
 from . import config
 
 
+def _unique_in_order(values: np.ndarray) -> np.ndarray:
+    """Drop duplicates from a 1-D array while keeping first-seen order"""
+    _, first_idx = np.unique(values, return_index=True)
+    return values[np.sort(first_idx)]
+
+
+def _degree_stats(degrees: np.ndarray) -> Dict:
+    """Summarize a per-user degree array the way get_statistics reports it"""
+    if degrees.size == 0:
+        return {"count": 0, "min": 0, "max": 0, "avg": 0}
+    return {
+        "count": int(degrees.size),
+        "min": int(degrees.min()),
+        "max": int(degrees.max()),
+        "avg": float(degrees.mean())
+    }
+
+
+class _AliasTable:
+    """Walker alias table (Vose's construction) for O(1) weighted draws.
+
+    Built once from a fixed weight vector; each draw then costs one uniform
+    index plus one coin flip instead of a search over cumulative weights.
+    """
+
+    def __init__(self, weights):
+        scaled = np.asarray(weights, dtype=np.float64)
+        n = scaled.size
+        scaled = (scaled * (n / scaled.sum())).tolist()
+
+        prob = [0.0] * n
+        alias = [0] * n
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            prob[s] = scaled[s]
+            alias[s] = l
+            scaled[l] = (scaled[l] + scaled[s]) - 1.0
+            (small if scaled[l] < 1.0 else large).append(l)
+        # Leftovers are exactly 1.0 up to floating-point error
+        for i in large + small:
+            prob[i] = 1.0
+
+        self.size = n
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.prob = np.asarray(prob, dtype=np.float64)
+        self.alias = np.asarray(alias, dtype=np.int64)
+
+    def sample(self, rng: np.random.Generator, k: int) -> np.ndarray:
+        """Draw k indices (with replacement) proportional to the weights"""
+        idx = rng.integers(0, self.size, k)
+        return np.where(rng.random(k) < self.prob[idx], idx, self.alias[idx])
+
+
+def _oversample_sizes(weights: np.ndarray, k_per_user: np.ndarray, slack: float = 1.1) -> np.ndarray:
+    """Draw count m for each k so that m weighted draws are expected to hold slack*k uniques.
+
+    With replacement, the expected number of distinct picks after m draws is
+    sum_i 1 - (1 - p_i)^m. Weights only take a few distinct values (one per
+    tier), so that sum is evaluated per distinct weight over a grid of m and
+    inverted with one searchsorted. Skewed weights get a larger oversample
+    instead of leaving the shortfall to the top-up pass.
+    """
+    values, counts = np.unique(weights, return_counts=True)
+    p = values / weights.sum()
+    k_max = int(k_per_user.max(initial=0))
+    grid = np.arange(1, 8 * k_max + 17)
+    # A single distinct weight gives p == 1; log1p(-1) = -inf is intended there
+    with np.errstate(divide='ignore'):
+        log_miss = np.log1p(-p)
+    expected = (counts * -np.expm1(log_miss * grid[:, None])).sum(axis=1)
+    # +1 covers the follower itself being drawn and discarded
+    wanted = np.ceil(k_per_user * slack) + 1
+    m = np.searchsorted(expected, wanted)
+    return grid[np.minimum(m, grid.size - 1)]
+
+
+def _grouped(keys: np.ndarray, values: np.ndarray) -> Iterator[Tuple[int, List[int]]]:
+    """Yield (key, [values...]) for each distinct key, via one stable sort"""
+    order = np.argsort(keys, kind="stable")
+    uids, starts = np.unique(keys[order], return_index=True)
+    bounds = np.append(starts, keys.size).tolist()
+    values = values[order]
+    for i, uid in enumerate(uids.tolist()):
+        yield uid, values[bounds[i]:bounds[i + 1]].tolist()
+
+
+def _seed_edges(
+    all_users: np.ndarray,
+    sampler: _AliasTable,
+    followers: np.ndarray,
+    k_per_user: np.ndarray,
+    rng: np.random.Generator
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Pick k_per_user[i] weighted followees (from the all_users pool) for followers[i].
+
+    Works purely on arrays with no generator state, so it can be run over
+    any slice of followers. Returns parallel (follower, followee) edge arrays.
+    """
+    # Each follower yields at most k edges, so one buffer of sum(k) fits all
+    total = int(k_per_user.sum())
+    src = np.empty(total, dtype=np.int64)
+    dst = np.empty(total, dtype=np.int64)
+    pos = 0
+    draw_sizes = _oversample_sizes(sampler.weights, k_per_user)
+    for follower_id, k, k_over in zip(followers.tolist(), k_per_user.tolist(), draw_sizes.tolist()):
+        # One oversampled draw with replacement, then drop duplicates/self in
+        # draw order; that usually yields k unique followees outright
+        batch = all_users[sampler.sample(rng, k_over)]
+        selected = _unique_in_order(batch[batch != follower_id])[:k]
+
+        # Collisions left us short: finish with an exact weighted draw
+        if selected.size < k:
+            selected = np.concatenate(
+                (selected, _weighted_top_up(all_users, sampler.weights, follower_id, selected, k, rng))
+            )
+
+        end = pos + selected.size
+        src[pos:end] = follower_id
+        dst[pos:end] = selected
+        pos = end
+
+    return src[:pos], dst[:pos]
+
+
+def _weighted_top_up(
+    all_users: np.ndarray,
+    weights: np.ndarray,
+    follower_id: int,
+    selected: np.ndarray,
+    k: int,
+    rng: np.random.Generator
+) -> np.ndarray:
+    """Draw the remaining k - len(selected) followees without replacement.
+
+    Efraimidis-Spirakis A-Res: key each candidate by log(u) / weight and keep
+    the largest keys. Continuing from the oversampled picks this way matches
+    sequential weighted sampling, and always returns as many followees as
+    there are eligible (non-zero weight, not self, not yet selected) users.
+    """
+    with np.errstate(divide="ignore"):
+        keys = np.log(rng.random(all_users.size)) / weights
+    keys[np.isin(all_users, np.append(selected, follower_id))] = -np.inf
+    m = min(k - selected.size, int(np.count_nonzero(keys > -np.inf)))
+    if m <= 0:
+        return np.empty(0, dtype=all_users.dtype)
+    return all_users[np.argpartition(keys, -m)[-m:]]
+
+
+# Candidates and alias table shared by every shard, set once per pool worker
+_shard_inputs: Optional[Tuple[np.ndarray, _AliasTable]] = None
+
+
+def _init_shard_worker(all_users: np.ndarray, sampler: _AliasTable):
+    """Process-pool initializer: receive the shared seeding inputs once per worker"""
+    global _shard_inputs
+    _shard_inputs = (all_users, sampler)
+
+
+def _seed_edges_shard(followers, k_per_user, seed):
+    """Seed one follower shard with its own RNG (process-pool entry point)"""
+    all_users, sampler = _shard_inputs
+    return _seed_edges(all_users, sampler, followers, k_per_user, np.random.default_rng(seed))
+
+
 class RelationshipGenerator:
     """Generate follow relationships with power-law / weighted model.
 
@@ -24,36 +193,48 @@ class RelationshipGenerator:
       - Following limits enforced per tier without destroying follower patterns
     """
 
-    def __init__(self, segments: Dict[str, List[int]], segmentation, verbose: bool = False):
+    def __init__(
+        self,
+        segments: Dict[str, List[int]],
+        segmentation,
+        verbose: bool = False,
+        workers: int = 1
+    ):
         self.segments = segments
         self.segmentation = segmentation
         self.verbose = verbose
+        # Processes used for the seeding phase (1 = run in-process)
+        self.workers = max(1, workers)
+        # Local PCG64 stream seeded from config: reproducible graphs, no shared
+        # global random state, and cheap to derive per-worker streams from
+        self.rng = np.random.default_rng(config.SEGMENTATION_SEED)
+
+        # Pre-compute user -> tier mapping for O(1) lookups: a dense int8 array
+        # indexed by user id (tier id = position in segments, -1 = unknown),
+        # plus per-tier weights, so per-user weights are one NumPy gather
+        self.tier_names: List[str] = list(segments)
+        # Every user in segment order, flattened once for all phases; the
+        # matching tier ids are just each tier id repeated len(segment) times
+        sizes = [len(users) for users in segments.values()]
+        self.all_users = np.fromiter(
+            chain.from_iterable(segments.values()), dtype=np.int64, count=sum(sizes)
+        )
+        max_uid = int(self.all_users.max(initial=-1))
+        self.tier_of = np.full(max_uid + 1, -1, dtype=np.int8)
+        self.tier_of[self.all_users] = np.repeat(np.arange(len(sizes), dtype=np.int8), sizes)
+        self.tier_weights_arr = np.array(
+            [config.TIER_WEIGHTS.get(tier, 1) for tier in self.tier_names], dtype=np.int64
+        )
 
         # Data structures
-        self.relationships: Set[Tuple[int, int]] = set()
-        self.follower_map: Dict[int, Set[int]] = defaultdict(set)
-        self.following_map: Dict[int, Set[int]] = defaultdict(set)
-
-        # Pre-compute user -> tier mapping for O(1) lookups
-        self.user_tier: Dict[int, str] = {}
-        for tier, users in segments.items():
-            for uid in users:
-                self.user_tier[uid] = tier
-    
-    def powerlaw_random(self, n: int, alpha: float = 2.5) -> int:
-        """
-        Generate a random number following power-law distribution
-        
-        Args:
-            n: Maximum value (exclusive - will return 0 to n-1)
-            alpha: Power-law exponent (default: 2.5 for social networks)
-            
-        Returns:
-            Random integer following power-law distribution (0 to n-1)
-        """
-        # Ensure result is within valid array index range [0, n-1]
-        result = int(n * (1 - random.random()) ** (1 / (1 - alpha)))
-        return min(result, n - 1)
+        # The adjacency maps are the only edge store: an edge exists iff
+        # followee in following_map[follower] (see has_edge); a separate edge
+        # set would mirror every insert and removal for no extra information.
+        # Every user gets its sets up front, so each dict is sized once and
+        # hot-path lookups never go through defaultdict's __missing__
+        user_list = self.all_users.tolist()
+        self.follower_map: Dict[int, Set[int]] = {uid: set() for uid in user_list}
+        self.following_map: Dict[int, Set[int]] = {uid: set() for uid in user_list}
     
     def generate_followers_first(self):
         """Weighted initial relationship seeding.
@@ -66,43 +247,98 @@ class RelationshipGenerator:
         if self.verbose:
             print("\n📊 Generating followers (weighted by tier)...")
 
-        # Flatten all users
-        all_users: List[int] = [u for tier_list in self.segments.values() for u in tier_list]
+        user_tiers = self.tier_of[self.all_users]
 
         # Weights by *followee* tier (top users attract more followers) - from config
-        weights = [config.TIER_WEIGHTS.get(self.user_tier[u], 1) for u in all_users]
-
-        # Per-tier following count ranges (dynamically from segmentation)
-        def following_target(user_id: int) -> int:
-            tier = self.user_tier[user_id]
-            min_following, max_following = self.segmentation.get_following_range(tier)
-            return random.randint(min_following, max_following)
-
-        for follower_id in all_users:
-            k = following_target(follower_id)
-            # Use random.choices (with replacement) then remove duplicates/self
-            # Retry sampling if needed to fill diversity (cap attempts from config)
-            attempts = 0
-            selected: Set[int] = set()
-            while len(selected) < k and attempts < config.MAX_FOLLOWEE_SELECTION_ATTEMPTS:
-                batch = random.choices(all_users, weights=weights, k=k)
-                for cand in batch:
-                    if cand == follower_id:
-                        continue
-                    selected.add(cand)
-                    if len(selected) >= k:
-                        break
-                attempts += 1
-
-            for followee_id in selected:
-                rel = (follower_id, followee_id)
-                if rel not in self.relationships:
-                    self.relationships.add(rel)
-                    self.follower_map[followee_id].add(follower_id)
-                    self.following_map[follower_id].add(followee_id)
-
-        print(f"✅ Seeded {len(self.relationships):,} preliminary relationships")
+        weights = self.tier_weights_arr[user_tiers]
+
+        # Per-tier following count ranges (dynamically from segmentation),
+        # indexed by tier id so every user's target is drawn in one call
+        ranges = [self.segmentation.get_following_range(tier) for tier in self.tier_names]
+        low_arr = np.array([low for low, _ in ranges], dtype=np.int64)
+        high_arr = np.array([high for _, high in ranges], dtype=np.int64)
+        k_per_user = self.rng.integers(low_arr[user_tiers], high_arr[user_tiers] + 1)
+
+        # Zero-weight users can never be picked as followees; leave them out
+        # of the candidate pool so they carry no dead probability mass
+        in_pool = weights > 0
+        if not in_pool.any():
+            raise ValueError("TIER_WEIGHTS leave no user with a non-zero weight to follow")
+        candidates = self.all_users[in_pool]
+
+        # Build the alias table once; each draw is then O(1) instead of
+        # random.choices rebuilding cumulative weights for every user
+        sampler = _AliasTable(weights[in_pool])
+
+        src, dst = self._seed_edges_sharded(candidates, sampler, self.all_users, k_per_user)
+
+        # Dedupe in one C sort rather than a set probe per edge, then drop
+        # edges that already exist (only possible if seeding is re-run)
+        keys, first_idx = np.unique((src << 32) | dst, return_index=True)
+        src, dst = src[first_idx], dst[first_idx]
+        if self.relationship_count:
+            fresh = ~np.isin(keys, self._edge_keys(), assume_unique=True)
+            src, dst = src[fresh], dst[fresh]
+        self._add_edges(src, dst)
+
+        print(f"✅ Seeded {self.relationship_count:,} preliminary relationships")
     
+    def _add_edges(self, src: np.ndarray, dst: np.ndarray):
+        """Insert new, distinct (src follows dst) edges into both adjacency maps.
+
+        Edges are grouped by endpoint with one sort per map, so each user's set
+        is extended once from a slice instead of one add() per edge.
+        """
+        for uid, followees in _grouped(src, dst):
+            self.following_map[uid].update(followees)
+        for uid, followers in _grouped(dst, src):
+            self.follower_map[uid].update(followers)
+
+    def _remove_edges(self, src: np.ndarray, dst: np.ndarray):
+        """Remove existing, distinct (src follows dst) edges from both adjacency maps.
+
+        Removals are batched like _add_edges: one difference_update per
+        touched user on each side instead of two discard() calls per edge.
+        """
+        for uid, followees in _grouped(src, dst):
+            self.following_map[uid].difference_update(followees)
+        for uid, followers in _grouped(dst, src):
+            self.follower_map[uid].difference_update(followers)
+
+    def _seed_edges_sharded(
+        self,
+        candidates: np.ndarray,
+        sampler: _AliasTable,
+        followers: np.ndarray,
+        k_per_user: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Seed edges over a fixed set of follower shards, each with its own RNG stream
+
+        Shard boundaries and seeds depend only on config.SEEDING_SHARDS, never
+        on self.workers, so a given seed yields the same graph for any worker
+        count; workers only decides whether the shards run in-process or in a
+        process pool.
+        """
+        shards = np.array_split(np.arange(followers.size), config.SEEDING_SHARDS)
+        seeds = self.rng.integers(0, 2**63 - 1, size=len(shards))
+        jobs = [(followers[shard], k_per_user[shard], int(seed)) for shard, seed in zip(shards, seeds)]
+        if self.workers > 1:
+            # The shared arrays go to each worker once; jobs carry only their shard
+            with ProcessPoolExecutor(
+                max_workers=min(self.workers, len(jobs)),
+                initializer=_init_shard_worker,
+                initargs=(candidates, sampler)
+            ) as pool:
+                futures = [pool.submit(_seed_edges_shard, *job) for job in jobs]
+                results = [f.result() for f in futures]
+        else:
+            results = [
+                _seed_edges(candidates, sampler, shard_followers, shard_k, np.random.default_rng(seed))
+                for shard_followers, shard_k, seed in jobs
+            ]
+        return (np.concatenate([src for src, _ in results]),
+                np.concatenate([dst for _, dst in results]))
+
     def enforce_following_limits(self):
         """
         Enforce following limits for each user type
@@ -111,38 +347,12 @@ class RelationshipGenerator:
         if self.verbose:
             print(f"\n🔧 Enforcing following limits...")
         
-        removed_count = 0
-        adjusted_count = 0
-        
-        for user_type, users in self.segments.items():
-            following_range = self.segmentation.get_following_range(user_type)
-            min_following = following_range[0]
-            max_following = following_range[1]
-            
-            for user_id in users:
-                current_following = len(self.following_map[user_id])
-                
-                if current_following > max_following:
-                    # Set a random target within the allowed range
-                    target_following = random.randint(min_following, max_following)
-                    excess = current_following - target_following
-                    
-                    if excess > 0:
-                        followings_list = list(self.following_map[user_id])
-                        to_remove = random.sample(followings_list, excess)
-                        
-                        for followee_id in to_remove:
-                            self.relationships.discard((user_id, followee_id))
-                            self.following_map[user_id].discard(followee_id)
-                            self.follower_map[followee_id].discard(user_id)
-                            removed_count += 1
-                        
-                        adjusted_count += 1
+        removed_count, adjusted_count = self._trim_following()
         
         if removed_count > 0:
             print(f"  Adjusted {adjusted_count:,} users")
             print(f"  Removed {removed_count:,} relationships to enforce following limits")
-        print(f"✅ Final relationship count: {len(self.relationships):,}")
+        print(f"✅ Final relationship count: {self.relationship_count:,}")
     
     def ensure_minimum_followers(self):
         """Enforce follower count ranges per tier with random individual targets.
@@ -162,10 +372,70 @@ class RelationshipGenerator:
         """
         print("\n🔧 Enforcing follower count ranges with random targets per user...")
 
+        added, trimmed, adjusted_users = self._fit_follower_counts()
+
+        print(f"  Adjusted {adjusted_users:,} users (added {added:,} links, trimmed {trimmed:,} links)")
+        print(f"✅ Final relationship count: {self.relationship_count:,}")
+
+    def finalize_graph(self):
+        """Apply following limits and then follower ranges in one step.
+
+        Same result as enforce_following_limits() followed by
+        ensure_minimum_followers(). Following trims only ever remove edges, so
+        running them first never disturbs the follower targets set afterwards;
+        over-limit users are found from a degree array rather than a second
+        full walk, and both phases report in a single summary.
+        """
+        print("\n🔧 Enforcing following limits and follower count ranges...")
+
+        removed, capped = self._trim_following()
+        added, trimmed, adjusted_users = self._fit_follower_counts()
+
+        print(f"  Following limits: trimmed {removed:,} links from {capped:,} users")
+        print(f"  Follower ranges: adjusted {adjusted_users:,} users "
+              f"(added {added:,} links, trimmed {trimmed:,} links)")
+        print(f"✅ Final relationship count: {self.relationship_count:,}")
+
+    def _trim_following(self) -> Tuple[int, int]:
+        """Trim users above their tier's following max; returns (links removed, users adjusted)"""
+        removed_src: List[np.ndarray] = []
+        removed_dst: List[np.ndarray] = []
+        adjusted_count = 0
+        
+        for user_type, users in self.segments.items():
+            min_following, max_following = self.segmentation.get_following_range(user_type)
+            
+            # Only users over the limit need work; find them from degrees alone
+            counts = np.fromiter(
+                (len(self.following_map.get(uid, ())) for uid in users), dtype=np.int64, count=len(users)
+            )
+            for idx in np.flatnonzero(counts > max_following).tolist():
+                user_id = users[idx]
+                # Set a random target within the allowed range
+                target_following = int(self.rng.integers(min_following, max_following + 1))
+                excess = int(counts[idx]) - target_following
+                
+                if excess > 0:
+                    # Only pick victims here; removals are applied in one batch
+                    to_remove = self._sample_from_set(self.following_map[user_id], excess)
+                    removed_src.append(np.full(excess, user_id, dtype=np.int64))
+                    removed_dst.append(to_remove)
+                    adjusted_count += 1
+        
+        if not removed_src:
+            return 0, 0
+        src, dst = np.concatenate(removed_src), np.concatenate(removed_dst)
+        self._remove_edges(src, dst)
+        return int(src.size), adjusted_count
+
+    def _fit_follower_counts(self) -> Tuple[int, int, int]:
+        """Trim or pad every user to a random follower target in its tier's range.
+
+        Returns (links added, links trimmed, users adjusted).
+        """
         # Use segmentation's dynamic follower ranges (based on % of total users)
         # No more hardcoded values!
         
-        all_users: List[int] = [u for tier_list in self.segments.values() for u in tier_list]
         added = 0
         trimmed = 0
         adjusted_users = 0
@@ -178,80 +448,189 @@ class RelationshipGenerator:
             
             min_followers, max_followers = target_range
             
-            for uid in users:
-                current = len(self.follower_map[uid])
-                
-                # Assign random target within tier range for this specific user
-                target = random.randint(min_followers, max_followers)
-                
-                # Trim if above target
-                if current > target:
-                    excess = current - target
-                    to_remove = random.sample(list(self.follower_map[uid]), excess)
-                    for follower_id in to_remove:
-                        self.follower_map[uid].discard(follower_id)
-                        self.following_map[follower_id].discard(uid)
-                        self.relationships.discard((follower_id, uid))
-                        trimmed += 1
-                    adjusted_users += 1
-                
-                # Pad if below target
-                elif current < target:
-                    needed = target - current
-                    # Candidate pool: all users except self and existing followers
-                    candidates = [c for c in all_users if c != uid and c not in self.follower_map[uid]]
-                    if not candidates:
-                        continue
-                    k = min(needed, len(candidates))
-                    new_followers = random.sample(candidates, k)
-                    for fid in new_followers:
-                        if (fid, uid) in self.relationships:
-                            continue
-                        self.relationships.add((fid, uid))
-                        self.follower_map[uid].add(fid)
-                        self.following_map[fid].add(uid)
-                        added += 1
-                    adjusted_users += 1
+            # Assign random targets within tier range for every user of the
+            # tier in one draw, and compare against all current counts at once
+            n = len(users)
+            targets = self.rng.integers(min_followers, max_followers + 1, size=n)
+            current = np.fromiter(
+                (len(self.follower_map.get(uid, ())) for uid in users), dtype=np.int64, count=n
+            )
+            gap = targets - current
+            
+            # Trim users above their target: pick victims per user, then
+            # apply the tier's removals in one batch
+            trim_idx = np.flatnonzero(gap < 0).tolist()
+            if trim_idx:
+                victims = [self._sample_from_set(self.follower_map[users[idx]], int(-gap[idx]))
+                           for idx in trim_idx]
+                followees = np.repeat(
+                    np.asarray([users[idx] for idx in trim_idx], dtype=np.int64),
+                    [v.size for v in victims]
+                )
+                self._remove_edges(np.concatenate(victims), followees)
+                trimmed += followees.size
+                adjusted_users += len(trim_idx)
+            
+            # Users below target are padded together after the tier's trims
+            pad_idx = np.flatnonzero(gap > 0)
+            deficits: List[Tuple[int, int]] = [
+                (users[idx], needed) for idx, needed in zip(pad_idx.tolist(), gap[pad_idx].tolist())
+            ]
+
+            tier_added, tier_padded = self._pad_followers(deficits)
+            added += tier_added
+            adjusted_users += tier_padded
+
+        return added, trimmed, adjusted_users
+
+    def _pad_followers(self, deficits: List[Tuple[int, int]]) -> Tuple[int, int]:
+        """Add new followers to each (uid, needed) pair; returns (links added, users padded).
+
+        Candidates for the whole batch come from one oversampled uniform draw
+        that is sliced per user, so the RNG is called once per tier instead of
+        once per user. Users that need a large share of all users, or whose
+        slice comes up short, fall back to _sample_new_followers.
+        """
+        n = self.all_users.size
+        pooled = [(uid, needed) for uid, needed in deficits if needed * 4 <= n]
+        slice_sizes = [int(needed * 1.3) + 4 for _, needed in pooled]
+        pool = self.rng.choice(self.all_users, size=sum(slice_sizes))
+        pooled_sizes = dict(zip((uid for uid, _ in pooled), slice_sizes))
+
+        # Dense "already follows uid (or is uid)" bitmap indexed by user id;
+        # one buffer is reused across users and cleared after each of them
+        taken = np.zeros(self.tier_of.size, dtype=np.uint8)
+
+        added = 0
+        padded = 0
+        offset = 0
+        for uid, needed in deficits:
+            existing = self.follower_map[uid]
+            existing_arr = np.fromiter(existing, dtype=np.int64, count=len(existing))
+            taken[existing_arr] = 1
+            taken[uid] = 1
+
+            new_followers = np.empty(0, dtype=np.int64)
+            size = pooled_sizes.get(uid)
+            if size is not None:
+                candidates = pool[offset:offset + size]
+                new_followers = _unique_in_order(candidates[taken[candidates] == 0])[:needed]
+                taken[new_followers] = 1
+                offset += size
+            if new_followers.size < needed:
+                extra = self._sample_new_followers(needed - new_followers.size, taken)
+                new_followers = np.concatenate((new_followers, extra))
+
+            taken[existing_arr] = 0
+            taken[new_followers] = 0
+            taken[uid] = 0
+            if not new_followers.size:
+                continue
+
+            # Candidates were already filtered against the bitmap, so they are
+            # new edges: no membership probe, one bulk update for uid's side
+            new_list = new_followers.tolist()
+            existing.update(new_list)
+            following_map = self.following_map
+            for fid in new_list:
+                following_map[fid].add(uid)
+            added += new_followers.size
+            padded += 1
+        return added, padded
+
+    def _sample_from_set(self, values: Set[int], k: int) -> np.ndarray:
+        """Draw k distinct members of a set without building a Python list"""
+        arr = np.fromiter(values, dtype=np.int64, count=len(values))
+        return self.rng.choice(arr, k, replace=False)
+
+    def _sample_new_followers(self, needed: int, taken: np.ndarray) -> np.ndarray:
+        """Pick up to `needed` distinct users whose entry in the `taken` bitmap is 0.
+
+        Uses rejection sampling against the bitmap, so the cost is O(needed)
+        rather than a scan over every user. Falls back to masking the full
+        user array when the request is a large fraction of all users or
+        rejection comes up short.
+        """
+        n = self.all_users.size
+
+        if needed * 4 <= n:
+            draws = self.rng.choice(self.all_users, size=min(2 * needed, n), replace=False)
+            fresh = draws[taken[draws] == 0]
+            if fresh.size >= needed:
+                return fresh[:needed]
+
+        candidates = self.all_users[taken[self.all_users] == 0]
+        k = min(needed, candidates.size)
+        return self.rng.choice(candidates, k, replace=False)
+
+    @property
+    def relationship_count(self) -> int:
+        """Number of follow relationships (edges) in the graph"""
+        return sum(map(len, self.following_map.values()))
+
+    def has_edge(self, follower_id: int, followee_id: int) -> bool:
+        """Whether follower_id follows followee_id"""
+        return followee_id in self.following_map.get(follower_id, ())
+
+    def _edge_keys(self) -> np.ndarray:
+        """All edges as packed (follower << 32) | followee int64 keys"""
+        degrees = np.fromiter(map(len, self.following_map.values()), dtype=np.int64,
+                              count=len(self.following_map))
+        followers = np.fromiter(self.following_map.keys(), dtype=np.int64, count=len(self.following_map))
+        followees = np.fromiter(chain.from_iterable(self.following_map.values()), dtype=np.int64,
+                                count=int(degrees.sum()))
+        return (np.repeat(followers, degrees) << 32) | followees
+
+    def _degree_array(self, adjacency: Dict[int, Set[int]]) -> np.ndarray:
+        """Per-user set sizes from an adjacency map, indexed by user id (0 if absent)"""
+        degrees = np.zeros(self.tier_of.size, dtype=np.int32)
+        if adjacency:
+            uids = np.fromiter(adjacency.keys(), dtype=np.int64, count=len(adjacency))
+            degrees[uids] = np.fromiter(map(len, adjacency.values()), dtype=np.int32, count=len(adjacency))
+        return degrees
 
-        print(f"  Adjusted {adjusted_users:,} users (added {added:,} links, trimmed {trimmed:,} links)")
-        print(f"✅ Final relationship count: {len(self.relationships):,}")
-    
     def get_statistics(self) -> Dict:
         """Get statistics about the generated relationships"""
         stats = {
-            "total_relationships": len(self.relationships),
+            "total_relationships": self.relationship_count,
             "follower_stats": {},
             "following_stats": {}
         }
         
+        # Degrees come straight from the live maps: O(users), no edge copies
+        follower_deg = self._degree_array(self.follower_map)
+        following_deg = self._degree_array(self.following_map)
+        # all_users is the segments concatenated in order, so each tier's ids
+        # are a slice of it rather than a fresh array built from its list
+        start = 0
         for user_type, users in self.segments.items():
-            follower_counts = [len(self.follower_map[uid]) for uid in users]
-            following_counts = [len(self.following_map[uid]) for uid in users]
-            
-            stats["follower_stats"][user_type] = {
-                "count": len(users),
-                "min": min(follower_counts) if follower_counts else 0,
-                "max": max(follower_counts) if follower_counts else 0,
-                "avg": sum(follower_counts) / len(follower_counts) if follower_counts else 0
-            }
-            
-            stats["following_stats"][user_type] = {
-                "count": len(users),
-                "min": min(following_counts) if following_counts else 0,
-                "max": max(following_counts) if following_counts else 0,
-                "avg": sum(following_counts) / len(following_counts) if following_counts else 0
-            }
+            idx = self.all_users[start:start + len(users)]
+            start += len(users)
+            stats["follower_stats"][user_type] = _degree_stats(follower_deg[idx])
+            stats["following_stats"][user_type] = _degree_stats(following_deg[idx])
         
         return stats
     
+    def iter_relationships(self) -> Iterator[Tuple[int, int]]:
+        """Lazily yield (follower_id, followee_id) tuples without building a set"""
+        return ((follower_id, followee_id)
+                for follower_id, followees in self.following_map.items()
+                for followee_id in followees)
+
     def get_relationships(self) -> Set[Tuple[int, int]]:
-        """Get all generated relationships"""
-        return self.relationships
+        """Get all generated relationships as (follower_id, followee_id) tuples"""
+        return set(self.iter_relationships())
     
+    def get_user_tier(self, user_id: int) -> str:
+        """Get the tier name of a user ("" if the user is not in any segment)"""
+        if 0 <= user_id < self.tier_of.size and self.tier_of[user_id] >= 0:
+            return self.tier_names[self.tier_of[user_id]]
+        return ""
+
     def get_follower_map(self) -> Dict[int, Set[int]]:
-        """Get follower mapping"""
-        return dict(self.follower_map)
+        """Get follower mapping (users with no followers are omitted)"""
+        return {uid: followers for uid, followers in self.follower_map.items() if followers}
     
     def get_following_map(self) -> Dict[int, Set[int]]:
-        """Get following mapping"""
-        return dict(self.following_map)
+        """Get following mapping (users who follow nobody are omitted)"""
+        return {uid: following for uid, following in self.following_map.items() if following}
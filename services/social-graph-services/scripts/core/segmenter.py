@@ -6,8 +6,10 @@ Handles the logic for segmenting users into different tiers based on configurati
 All ratios and thresholds are defined in config.py.
 """
 
-import random
 from typing import List, Dict
+
+import numpy as np
+
 from . import config
 
 
@@ -22,35 +24,45 @@ class UserSegmentation:
         self.medium_count = int(total_users * config.USER_TIER_RATIOS["medium"])
         self.big_count = int(total_users * config.USER_TIER_RATIOS["big"])
         self.top_count = max(1, total_users - self.small_count - self.medium_count - self.big_count)
+        
+        # Tier boundaries within the shuffled user list (top takes the rest)
+        self._small_end = self.small_count
+        self._medium_end = self._small_end + self.medium_count
+        self._big_end = self._medium_end + self.big_count
+        
+        # Ranges depend only on total_users and config: compute each tier's once
+        self._follower_ranges = {
+            tier: self._compute_follower_range(tier) for tier in config.FOLLOWER_RATIOS
+        }
+        self._following_ranges = {
+            tier: self._compute_following_range(tier) for tier in config.FOLLOWING_RATIOS
+        }
     
     def segment_users(self, user_ids: List[int]) -> Dict[str, List[int]]:
         """
         Segment users into different tiers
         
         Args:
-            user_ids: List of user IDs to segment
+            user_ids: List or int array of user IDs to segment
             
         Returns:
             Dictionary mapping segment names to lists of user IDs
         """
-        shuffled_users = user_ids.copy()
-        # Use fixed seed from config for consistent, reproducible segmentation across runs
-        if config.SEGMENTATION_SEED is not None:
-            random.seed(config.SEGMENTATION_SEED)
-        random.shuffle(shuffled_users)
-        if config.SEGMENTATION_SEED is not None:
-            random.seed()  # Reset to random seed for subsequent operations
+        # Shuffle once in C with a local Generator seeded from config: consistent,
+        # reproducible segmentation across runs without touching global random
+        # state (SEGMENTATION_SEED = None gives a fresh shuffle each time).
+        # One owned copy shuffled in place: no separate permutation index array
+        rng = np.random.default_rng(config.SEGMENTATION_SEED)
+        shuffled = np.array(user_ids, dtype=np.int64)
+        rng.shuffle(shuffled)
+        
+        small_end, medium_end, big_end = self._small_end, self._medium_end, self._big_end
         
         segments = {
-            "small": shuffled_users[:self.small_count],
-            "medium": shuffled_users[self.small_count:self.small_count + self.medium_count],
-            "big": shuffled_users[
-                self.small_count + self.medium_count:
-                self.small_count + self.medium_count + self.big_count
-            ],
-            "top": shuffled_users[
-                self.small_count + self.medium_count + self.big_count:
-            ]
+            "small": shuffled[:small_end].tolist(),
+            "medium": shuffled[small_end:medium_end].tolist(),
+            "big": shuffled[medium_end:big_end].tolist(),
+            "top": shuffled[big_end:].tolist()
         }
         
         return segments
@@ -68,16 +80,7 @@ class UserSegmentation:
         Returns:
             Tuple of (min_followers, max_followers)
         """
-        if user_type not in config.FOLLOWER_RATIOS:
-            return (0, 0)
-        
-        min_ratio, max_ratio = config.FOLLOWER_RATIOS[user_type]
-        abs_min = config.FOLLOWER_ABSOLUTE_MINIMUMS[user_type]
-        
-        min_followers = max(abs_min, int(self.total_users * min_ratio))
-        max_followers = max(min_followers + 1, int(self.total_users * max_ratio))
-        
-        return (min_followers, max_followers)
+        return self._follower_ranges.get(user_type, (0, 0))
     
     def get_following_range(self, user_type: str) -> tuple:
         """
@@ -92,9 +95,20 @@ class UserSegmentation:
         Returns:
             Tuple of (min_following, max_following)
         """
-        if user_type not in config.FOLLOWING_RATIOS:
-            return (0, 0)
+        return self._following_ranges.get(user_type, (0, 0))
+    
+    def _compute_follower_range(self, user_type: str) -> tuple:
+        """Follower range for a tier present in config.FOLLOWER_RATIOS"""
+        min_ratio, max_ratio = config.FOLLOWER_RATIOS[user_type]
+        abs_min = config.FOLLOWER_ABSOLUTE_MINIMUMS[user_type]
         
+        min_followers = max(abs_min, int(self.total_users * min_ratio))
+        max_followers = max(min_followers + 1, int(self.total_users * max_ratio))
+        
+        return (min_followers, max_followers)
+    
+    def _compute_following_range(self, user_type: str) -> tuple:
+        """Following range for a tier present in config.FOLLOWING_RATIOS"""
         min_ratio, max_ratio = config.FOLLOWING_RATIOS[user_type]
         abs_min = config.FOLLOWING_ABSOLUTE_MINIMUMS[user_type]
         abs_max = config.FOLLOWING_ABSOLUTE_MAXIMUMS[user_type]
@@ -118,7 +118,7 @@ source "${VENV_DIR}/bin/activate" || {
 }
 
 # Check if requirements are installed
-if ! python -c "import boto3" 2>/dev/null; then
+if ! python -c "import boto3, numpy" 2>/dev/null; then
     echo -e "${YELLOW}Installing Python dependencies...${NC}"
     pip install --upgrade pip || {
         echo -e "${RED}❌ Failed to upgrade pip${NC}"
@@ -138,7 +138,7 @@ echo ""
 
 # Check if requirements are installed
 echo -e "${YELLOW}📦 Checking Python dependencies...${NC}"
-if ! python3 -c "import boto3" 2>/dev/null; then
+if ! python3 -c "import boto3, numpy" 2>/dev/null; then
     echo -e "${YELLOW}Installing Python dependencies...${NC}"
     pip3 install -r "${SCRIPT_DIR}/requirements.txt" || {
         echo -e "${RED}❌ Failed to install dependencies${NC}"
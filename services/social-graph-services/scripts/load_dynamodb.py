@@ -7,7 +7,7 @@ Generates relationships using the core generator and uploads to AWS DynamoDB
 import sys
 import os
 import json
-import boto3
+import numpy as np
 from typing import Dict, Set
 from collections import defaultdict
 
@@ -15,6 +15,7 @@ from collections import defaultdict
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from core.segmenter import UserSegmentation
 from core.generator import RelationshipGenerator
+from core.dynamodb import write_relationship_tables
 
 
 def load_to_dynamodb(
@@ -22,7 +23,8 @@ def load_to_dynamodb(
     following_map: Dict[int, Set[int]],
     followers_table_name: str,
     following_table_name: str,
-    region: str = "us-west-2"
+    region: str = "us-west-2",
+    write_workers: int = 8
 ):
     """
     Load relationship data into DynamoDB tables
@@ -33,19 +35,12 @@ def load_to_dynamodb(
         followers_table_name: Name of the followers table
         following_table_name: Name of the following table
         region: AWS region
+        write_workers: Writer threads per table
     """
     print(f"\n Loading data to DynamoDB in region {region}...")
     print(f"   Followers table: {followers_table_name}")
     print(f"   Following table: {following_table_name}")
     
-    # Initialize DynamoDB client
-    dynamodb = boto3.resource('dynamodb', region_name=region)
-    followers_table = dynamodb.Table(followers_table_name)
-    following_table = dynamodb.Table(following_table_name)
-    
-    # Batch write to followers table
-    print(f"\n Writing to {followers_table_name}...")
-    
     # Debug: Check sample users before writing and identify top users
     print(f"\n Debug - Checking follower counts before write:")
     
@@ -61,28 +56,13 @@ def load_to_dynamodb(
             sample = list(follower_map[user_id])[:3]
             print(f"   User {user_id}: {count} followers (sample: {sample})")
     
-    with followers_table.batch_writer() as batch:
-        for user_id, followers in follower_map.items():
-            if followers:  # Only write if user has followers
-                item = {
-                    'user_id': str(user_id),
-                    'follower_ids': list(map(str, sorted(followers)))
-                }
-                batch.put_item(Item=item)
+    # Write both tables concurrently
+    print(f"\n Writing to {followers_table_name} and {following_table_name}...")
+    write_relationship_tables(
+        follower_map, following_map, followers_table_name, following_table_name, region, write_workers
+    )
     
     print(f" Wrote {len(follower_map)} users to {followers_table_name}")
-    
-    # Batch write to following table
-    print(f"\n Writing to {following_table_name}...")
-    with following_table.batch_writer() as batch:
-        for user_id, following in following_map.items():
-            if following:  # Only write if user is following someone
-                item = {
-                    'user_id': str(user_id),
-                    'following_ids': list(map(str, sorted(following)))
-                }
-                batch.put_item(Item=item)
-
     print(f" Wrote {len(following_map)} users to {following_table_name}")
 
 
@@ -91,7 +71,9 @@ def generate_and_load(
     followers_table_name: str = "social-graph-followers",
     following_table_name: str = "social-graph-following",
     region: str = "us-west-2",
-    verbose: bool = True
+    verbose: bool = True,
+    workers: int = 1,
+    write_workers: int = 8
 ):
     """
     Generate relationships and load them into DynamoDB
@@ -102,13 +84,15 @@ def generate_and_load(
         following_table_name: Name of the following DynamoDB table
         region: AWS region
         verbose: Print detailed progress
+        workers: Worker processes for relationship seeding
+        write_workers: Writer threads per DynamoDB table
     """
     print(f"\n Generating and loading social graph data for {total_users:,} users")
     print(f"=" * 80)
     
     # Step 1: Segment users
     print("\n Step 1: Segmenting users...")
-    user_ids = list(range(1, total_users + 1))
+    user_ids = np.arange(1, total_users + 1, dtype=np.int64)
     segmentation = UserSegmentation(total_users)
     segments = segmentation.segment_users(user_ids)
     
@@ -118,25 +102,28 @@ def generate_and_load(
     
     # Step 2: Generate relationships
     print("\n Step 2: Generating relationships...")
-    generator = RelationshipGenerator(segments, segmentation, verbose=verbose)
+    generator = RelationshipGenerator(segments, segmentation, verbose=verbose, workers=workers)
     generator.generate_followers_first()
-    # Ensure minimum followers requirement
-    generator.ensure_minimum_followers()
-    # Note: We DON'T enforce following limits after ensuring followers
+    # Cap following counts, then fit follower counts to their tier ranges.
+    # Note: following limits are NOT re-applied after the follower pass
     # because it would break the carefully constructed follower counts
-    # Following limits will naturally be enforced by ensure_minimum_followers logic
+    generator.finalize_graph()
     
     # Step 3: Get statistics
     print("\n Step 3: Relationship statistics...")
-    stats = generator.get_statistics()
-    print(f"  Total relationships: {stats['total_relationships']:,}")
-    
-    for user_type in ["small", "medium", "big", "top"]:
-        follower_stats = stats["follower_stats"][user_type]
-        following_stats = stats["following_stats"][user_type]
-        print(f"\n  {user_type.capitalize()} users:")
-        print(f"    Followers: min={follower_stats['min']}, max={follower_stats['max']}, avg={follower_stats['avg']:.1f}")
-        print(f"    Following: min={following_stats['min']}, max={following_stats['max']}, avg={following_stats['avg']:.1f}")
+    if verbose:
+        stats = generator.get_statistics()
+        print(f"  Total relationships: {stats['total_relationships']:,}")
+        
+        for user_type in ["small", "medium", "big", "top"]:
+            follower_stats = stats["follower_stats"][user_type]
+            following_stats = stats["following_stats"][user_type]
+            print(f"\n  {user_type.capitalize()} users:")
+            print(f"    Followers: min={follower_stats['min']}, max={follower_stats['max']}, avg={follower_stats['avg']:.1f}")
+            print(f"    Following: min={following_stats['min']}, max={following_stats['max']}, avg={following_stats['avg']:.1f}")
+    else:
+        # Per-tier degree stats walk every adjacency set; only the total is cheap
+        print(f"  Total relationships: {generator.relationship_count:,}")
     
     # Step 4: Load to DynamoDB
     print("\n Step 4: Loading to DynamoDB...")
@@ -148,7 +135,8 @@ def generate_and_load(
         following_map=following_map,
         followers_table_name=followers_table_name,
         following_table_name=following_table_name,
-        region=region
+        region=region,
+        write_workers=write_workers
     )
 
     print(f"\n Successfully loaded {total_users:,} users to DynamoDB!")
@@ -185,6 +173,18 @@ if __name__ == "__main__":
         default="us-west-2",
         help="AWS region (default: us-west-2)"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for relationship seeding (default: 1)"
+    )
+    parser.add_argument(
+        "--write-workers",
+        type=int,
+        default=8,
+        help="Writer threads per DynamoDB table (default: 8)"
+    )
     parser.add_argument(
         "--quiet",
         action="store_true",
@@ -199,7 +199,9 @@ if __name__ == "__main__":
             followers_table_name=args.followers_table,
             following_table_name=args.following_table,
             region=args.region,
-            verbose=not args.quiet
+            verbose=not args.quiet,
+            workers=args.workers,
+            write_workers=args.write_workers
         )
     except Exception as e:
         print(f"\n Error: {e}")
@@ -7,15 +7,17 @@ Validates users exist in user-service via gRPC BatchGetUserInfo before generatin
 import sys
 import os
 import json
-import boto3
+import numpy as np
 import grpc
 from typing import Dict, Set, List
 from collections import defaultdict
 
 # Add parent directory to path to import core modules
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from core import config
 from core.segmenter import UserSegmentation
 from core.generator import RelationshipGenerator
+from core.dynamodb import write_relationship_tables
 
 # Import generated gRPC code
 # Assuming proto files are in the project root proto/ directory
@@ -43,9 +45,6 @@ def fetch_user_ids_from_service(grpc_endpoint: str, max_users: int = None) -> Li
     Returns:
         List of valid user IDs
     """
-    # Import config for constants
-    from core import config
-    
     print(f"\n🔍 Fetching users from user-service at {grpc_endpoint}...")
     
     # Scan users in batches using config values
@@ -54,26 +53,39 @@ def fetch_user_ids_from_service(grpc_endpoint: str, max_users: int = None) -> Li
     current_batch_start = 1
     consecutive_empty_batches = 0
     max_empty_batches = config.MAX_CONSECUTIVE_EMPTY_BATCHES
+    window = config.GRPC_MAX_IN_FLIGHT
     
     try:
         # Create gRPC channel
         channel = grpc.insecure_channel(grpc_endpoint)
         stub = user_service_pb2_grpc.UserServiceStub(channel)
         
-        print("   Scanning for users in batches of 100...")
+        print(f"   Scanning for users in batches of {batch_size} ({window} in flight)...")
         
-        while consecutive_empty_batches < max_empty_batches:
-            # Build batch of user IDs to check
-            batch_ids = list(range(current_batch_start, current_batch_start + batch_size))
+        done = False
+        while not done:
+            # Issue a window of BatchGetUserInfo calls at once, then consume them in order
+            starts = range(current_batch_start, current_batch_start + window * batch_size, batch_size)
+            futures = [
+                stub.BatchGetUserInfo.future(
+                    user_service_pb2.BatchGetUserInfoRequest(user_ids=range(start, start + batch_size)),
+                    timeout=10
+                )
+                for start in starts
+            ]
             
-            # Call BatchGetUserInfo
-            request = user_service_pb2.BatchGetUserInfoRequest(user_ids=batch_ids)
-            try:
-                response = stub.BatchGetUserInfo(request, timeout=10)
+            for start, future in zip(starts, futures):
+                try:
+                    response = future.result()
+                except grpc.RpcError as e:
+                    print(f"   ⚠️  gRPC error: {e.code()} - {e.details()}")
+                    done = True
+                    break
                 
                 # Check for errors
                 if response.error_code:
                     print(f"   ⚠️  Warning: {response.error_message}")
+                    done = True
                     break
                 
                 # Collect found users
@@ -81,21 +93,24 @@ def fetch_user_ids_from_service(grpc_endpoint: str, max_users: int = None) -> Li
                 if found_in_batch:
                     user_ids.extend(found_in_batch)
                     consecutive_empty_batches = 0
-                    print(f"   Found {len(found_in_batch)} users in range {current_batch_start}-{current_batch_start + batch_size - 1}")
+                    print(f"   Found {len(found_in_batch)} users in range {start}-{start + batch_size - 1}")
                 else:
                     consecutive_empty_batches += 1
+                    if consecutive_empty_batches >= max_empty_batches:
+                        done = True
+                        break
                 
                 # Check if we've reached max_users
                 if max_users and len(user_ids) >= max_users:
                     user_ids = user_ids[:max_users]
                     print(f"   Reached max_users limit: {max_users}")
+                    done = True
                     break
-                
-            except grpc.RpcError as e:
-                print(f"   ⚠️  gRPC error: {e.code()} - {e.details()}")
-                break
             
-            current_batch_start += batch_size
+            # Drop lookups issued past the point where the scan stopped
+            for future in futures:
+                future.cancel()
+            current_batch_start += window * batch_size
         
         channel.close()
         
@@ -122,7 +137,8 @@ def load_to_dynamodb(
     following_map: Dict[int, Set[int]],
     followers_table_name: str,
     following_table_name: str,
-    region: str = "us-west-2"
+    region: str = "us-west-2",
+    write_workers: int = 8
 ):
     """
     Load relationship data into DynamoDB tables
@@ -133,46 +149,24 @@ def load_to_dynamodb(
         followers_table_name: Name of the followers table
         following_table_name: Name of the following table
         region: AWS region
+        write_workers: Writer threads per table
     """
     print(f"\n📦 Loading data to DynamoDB in region {region}...")
     print(f"   Followers table: {followers_table_name}")
     print(f"   Following table: {following_table_name}")
     
-    # Initialize DynamoDB client
-    dynamodb = boto3.resource('dynamodb', region_name=region)
-    followers_table = dynamodb.Table(followers_table_name)
-    following_table = dynamodb.Table(following_table_name)
-    
-    # Batch write to followers table
-    print(f"\n   Writing to {followers_table_name}...")
-    
     # Debug: Check sample users before writing
     if follower_map:
         max_followers_user = max(follower_map.items(), key=lambda x: len(x[1]))
         print(f"   Max followers: User {max_followers_user[0]} has {len(max_followers_user[1])} followers")
     
-    with followers_table.batch_writer() as batch:
-        for user_id, followers in follower_map.items():
-            if followers:  # Only write if user has followers
-                item = {
-                    'user_id': str(user_id),
-                    'follower_ids': list(map(str, sorted(followers)))
-                }
-                batch.put_item(Item=item)
+    # Write both tables concurrently
+    print(f"\n   Writing to {followers_table_name} and {following_table_name}...")
+    write_relationship_tables(
+        follower_map, following_map, followers_table_name, following_table_name, region, write_workers
+    )
     
     print(f"   ✅ Wrote {len(follower_map)} users to {followers_table_name}")
-    
-    # Batch write to following table
-    print(f"\n   Writing to {following_table_name}...")
-    with following_table.batch_writer() as batch:
-        for user_id, following in following_map.items():
-            if following:  # Only write if user is following someone
-                item = {
-                    'user_id': str(user_id),
-                    'following_ids': list(map(str, sorted(following)))
-                }
-                batch.put_item(Item=item)
-
     print(f"   ✅ Wrote {len(following_map)} users to {following_table_name}")
 
 
@@ -183,7 +177,9 @@ def generate_and_load(
     following_table_name: str = "social-graph-following",
     region: str = "us-west-2",
     verbose: bool = True,
-    skip_validation: bool = False
+    skip_validation: bool = False,
+    workers: int = 1,
+    write_workers: int = 8
 ):
     """
     Generate relationships and load them into DynamoDB
@@ -196,6 +192,8 @@ def generate_and_load(
         region: AWS region
         verbose: Print detailed progress
         skip_validation: Skip user validation and use sequential IDs (for testing)
+        workers: Worker processes for relationship seeding
+        write_workers: Writer threads per DynamoDB table
     """
     print(f"\n🚀 Generating and loading social graph data")
     print(f"=" * 80)
@@ -203,7 +201,7 @@ def generate_and_load(
     # Step 1: Fetch or generate user IDs
     if skip_validation:
         print("\n⚠️  Skipping user validation (using sequential IDs)")
-        user_ids = list(range(1, (max_users or 5000) + 1))
+        user_ids = np.arange(1, (max_users or 5000) + 1, dtype=np.int64)
         total_users = len(user_ids)
     else:
         if not grpc_endpoint:
@@ -231,21 +229,25 @@ def generate_and_load(
     
     # Step 3: Generate relationships
     print("\n   Step 2: Generating relationships...")
-    generator = RelationshipGenerator(segments, segmentation, verbose=verbose)
+    generator = RelationshipGenerator(segments, segmentation, verbose=verbose, workers=workers)
     generator.generate_followers_first()
-    generator.ensure_minimum_followers()
+    generator.finalize_graph()
     
     # Step 4: Get statistics
     print("\n   Step 3: Relationship statistics...")
-    stats = generator.get_statistics()
-    print(f"     Total relationships: {stats['total_relationships']:,}")
-    
-    for user_type in ["small", "medium", "big", "top"]:
-        follower_stats = stats["follower_stats"][user_type]
-        following_stats = stats["following_stats"][user_type]
-        print(f"\n     {user_type.capitalize()} users:")
-        print(f"       Followers: min={follower_stats['min']}, max={follower_stats['max']}, avg={follower_stats['avg']:.1f}")
-        print(f"       Following: min={following_stats['min']}, max={following_stats['max']}, avg={following_stats['avg']:.1f}")
+    if verbose:
+        stats = generator.get_statistics()
+        print(f"     Total relationships: {stats['total_relationships']:,}")
+        
+        for user_type in ["small", "medium", "big", "top"]:
+            follower_stats = stats["follower_stats"][user_type]
+            following_stats = stats["following_stats"][user_type]
+            print(f"\n     {user_type.capitalize()} users:")
+            print(f"       Followers: min={follower_stats['min']}, max={follower_stats['max']}, avg={follower_stats['avg']:.1f}")
+            print(f"       Following: min={following_stats['min']}, max={following_stats['max']}, avg={following_stats['avg']:.1f}")
+    else:
+        # Per-tier degree stats walk every adjacency set; only the total is cheap
+        print(f"     Total relationships: {generator.relationship_count:,}")
     
     # Step 5: Load to DynamoDB
     print("\n   Step 4: Loading to DynamoDB...")
@@ -257,7 +259,8 @@ def generate_and_load(
         following_map=following_map,
         followers_table_name=followers_table_name,
         following_table_name=following_table_name,
-        region=region
+        region=region,
+        write_workers=write_workers
     )
 
     print(f"\n✅ Successfully loaded {total_users:,} users to DynamoDB!")
@@ -303,6 +306,18 @@ if __name__ == "__main__":
         action="store_true",
         help="Skip user validation and use sequential IDs 1 to max-users (default: 5000)"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for relationship seeding (default: 1)"
+    )
+    parser.add_argument(
+        "--write-workers",
+        type=int,
+        default=8,
+        help="Writer threads per DynamoDB table (default: 8)"
+    )
     parser.add_argument(
         "--quiet",
         action="store_true",
@@ -319,7 +334,9 @@ if __name__ == "__main__":
             following_table_name=args.following_table,
             region=args.region,
             verbose=not args.quiet,
-            skip_validation=args.skip_validation
+            skip_validation=args.skip_validation,
+            workers=args.workers,
+            write_workers=args.write_workers
         )
     except KeyboardInterrupt:
         print("\n\n⚠️  Interrupted by user")
@@ -18,7 +18,7 @@ Write-Host ""
 
 # Check if boto3 is installed
 try {
-    python -c "import boto3" 2>$null
+    python -c "import boto3, numpy" 2>$null
 } catch {
     Write-Host "📦 Installing Python dependencies..." -ForegroundColor Yellow
     pip install -r requirements.txt
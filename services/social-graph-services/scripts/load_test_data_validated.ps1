@@ -78,7 +78,7 @@ if (-not $SkipValidation -and [string]::IsNullOrEmpty($GrpcEndpoint)) {
 # Check if boto3 is installed
 Write-Host "📦 Checking Python dependencies..." -ForegroundColor Yellow
 try {
-    python -c "import boto3" 2>$null
+    python -c "import boto3, numpy" 2>$null
     if ($LASTEXITCODE -ne 0) { throw }
 } catch {
     Write-Host "Installing Python dependencies..." -ForegroundColor Yellow
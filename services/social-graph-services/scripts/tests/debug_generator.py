@@ -39,7 +39,7 @@ print(f"  Sample followers: {list(gen.follower_map[top_user])[:10]}")
 
 # Check user_tier mapping
 print(f"\n🔍 User tier mapping:")
-print(f"  gen.user_tier[{top_user}] = {gen.user_tier.get(top_user, 'NOT FOUND')}")
+print(f"  gen.get_user_tier({top_user}) = {gen.get_user_tier(top_user) or 'NOT FOUND'}")
 
 # Check targets
 targets = {"small": 1, "medium": 100, "big": 500, "top": 2000}